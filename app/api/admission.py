@@ -0,0 +1,142 @@
+"""
+Admission control and load shedding.
+
+Each route is assigned a cost class with its own concurrency limit, so
+expensive calls (e.g. GET /movies) cannot occupy every worker thread and
+starve cheap lookups. Requests over the limit wait in a bounded queue for
+at most a deadline; when the queue is full or the deadline expires they
+are rejected right away with 503 and a Retry-After header.
+"""
+import asyncio
+from typing import Dict
+from weakref import WeakKeyDictionary
+
+from fastapi import Depends, HTTPException, status
+
+
+class CostClass:
+    """
+    Concurrency limit and bounded wait queue shared by routes of similar cost.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout: float,
+        retry_after: int = 1,
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+
+        self.in_flight = 0
+        self.queued = 0
+        self.rejected = 0
+
+        # asyncio primitives are bound to the event loop they first wait on,
+        # so one semaphore is kept per loop (e.g. across test clients)
+        self._semaphores: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            WeakKeyDictionary()
+        )
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    def _reject(self) -> HTTPException:
+        self.rejected += 1
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is overloaded. Please retry later.",
+            headers={"Retry-After": str(self.retry_after)},
+        )
+
+    async def acquire(self) -> None:
+        """
+        Takes a slot, waiting in the queue if none is free.
+
+        :raises HTTPException: 503 if the queue is full or the deadline expires
+        """
+        semaphore = self._semaphore()
+
+        if semaphore.locked():
+            if self.queued >= self.max_queue:
+                raise self._reject()
+
+            self.queued += 1
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                raise self._reject()
+            finally:
+                self.queued -= 1
+        else:
+            await semaphore.acquire()
+
+        self.in_flight += 1
+
+    def release(self) -> None:
+        """
+        Frees a slot taken by acquire().
+        """
+        self.in_flight -= 1
+        self._semaphore().release()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the current load and limits of this cost class.
+
+        :return: In-flight, queued and rejected counts, and the configured limits
+        """
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+        }
+
+
+# Limits add up to 32 of the 40 threads in the default worker threadpool.
+# The remaining threads are left for work outside any cost class, such as
+# response compression. Health and metrics handlers are async and need none.
+COST_CLASSES: Dict[str, CostClass] = {
+    # Full listings, whose cost grows with the catalog
+    "heavy": CostClass("heavy", max_concurrency=8, max_queue=32, queue_timeout=2.0, retry_after=2),
+    # Lookups and writes of a single entity
+    "light": CostClass("light", max_concurrency=24, max_queue=256, queue_timeout=0.5),
+}
+
+
+def admit(cost: str):
+    """
+    Route dependency enforcing the limits of the given cost class.
+
+    Usage: @router.get(..., dependencies=[admit("heavy")])
+
+    :param cost: Name of a cost class in COST_CLASSES
+    """
+    cost_class = COST_CLASSES[cost]
+
+    async def admission():
+        await cost_class.acquire()
+        try:
+            yield
+        finally:
+            cost_class.release()
+
+    return Depends(admission)
+
+
+def admission_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Returns in-flight, queued and rejected request counts per cost class.
+    """
+    return {name: cost_class.stats() for name, cost_class in COST_CLASSES.items()}
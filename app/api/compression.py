@@ -0,0 +1,220 @@
+"""
+Content-negotiated response compression.
+
+Large JSON bodies (e.g. GET /movies) are compressed with the best encoding
+accepted by the client. Compressed bodies of catalog routes are cached per
+URL, encoding and catalog version, so unchanged resources are not
+recompressed on every hit.
+"""
+import gzip
+import time
+from collections import OrderedDict, defaultdict
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from starlette.concurrency import run_in_threadpool
+
+from app.services.container import movie_service
+
+try:
+    import brotli
+except ImportError:  # Optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency
+    zstandard = None
+
+
+# Bodies smaller than this are sent as-is; compressing them costs more
+# CPU than the bandwidth it saves.
+MINIMUM_SIZE = 1024
+
+# Maximum number of compressed bodies kept in memory
+CACHE_SIZE = 256
+
+# Routes whose responses depend only on the catalog, so the catalog
+# version identifies their content. Other routes (e.g. /metrics) are
+# compressed on every request but never cached.
+CACHEABLE_ROUTES = frozenset({
+    "/movies",
+    "/movies/{movie_id}",
+    "/movies/{movie_id}/reviews",
+})
+
+
+def _compress_brotli(body: bytes) -> bytes:
+    return brotli.compress(body, quality=5)
+
+
+def _compress_zstd(body: bytes) -> bytes:
+    # Compressor objects are not thread-safe, so one is created per call
+    return zstandard.ZstdCompressor(level=3).compress(body)
+
+
+def _compress_gzip(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=6)
+
+
+# Available encodings, in order of preference
+COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {}
+if brotli is not None:
+    COMPRESSORS["br"] = _compress_brotli
+if zstandard is not None:
+    COMPRESSORS["zstd"] = _compress_zstd
+COMPRESSORS["gzip"] = _compress_gzip
+
+
+# (path, query, catalog version, encoding)
+#   -> (compressed body, media type, route, uncompressed size)
+_cache: "OrderedDict[Tuple[str, str, int, str], Tuple[bytes, str, str, int]]" = OrderedDict()
+
+# Per-route measurements of bandwidth saved against CPU spent
+_stats: Dict[str, Dict[str, float]] = defaultdict(
+    lambda: {
+        "compressed_responses": 0,
+        "cache_hits": 0,
+        "bytes_in": 0,
+        "bytes_out": 0,
+        "cpu_seconds": 0.0,
+    }
+)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Picks the preferred encoding accepted by the client.
+
+    :param accept_encoding: Value of the Accept-Encoding header
+    :return: Encoding name, or None if no supported encoding is accepted
+    """
+    accepted: Dict[str, float] = {}
+
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+
+        accepted[name] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in COMPRESSORS:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    return best
+
+
+def compression_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Returns per-route compression measurements, including the ratio of
+    bytes saved and the CPU time spent compressing.
+    """
+    report = {}
+    for route, stats in _stats.items():
+        saved = stats["bytes_in"] - stats["bytes_out"]
+        report[route] = {
+            **stats,
+            "bytes_saved": saved,
+            "ratio": stats["bytes_out"] / stats["bytes_in"] if stats["bytes_in"] else 1.0,
+            "kb_saved_per_cpu_ms": (
+                saved / 1024 / (stats["cpu_seconds"] * 1000)
+                if stats["cpu_seconds"] else 0.0
+            ),
+        }
+    return report
+
+
+def _route_template(request: Request) -> str:
+    """
+    Resolves the route path template (e.g. /movies/{movie_id}) used to
+    group measurements, instead of the concrete URL.
+    Only available once the request has been routed.
+    """
+    route = request.scope.get("route")
+    return getattr(route, "path", request.url.path)
+
+
+def _compress(encoding: str, body: bytes) -> Tuple[bytes, float]:
+    started = time.thread_time()
+    compressed = COMPRESSORS[encoding](body)
+    return compressed, time.thread_time() - started
+
+
+def _compressed_response(body: bytes, media_type: str, encoding: str) -> Response:
+    return Response(
+        content=body,
+        media_type=media_type,
+        headers={
+            "Content-Encoding": encoding,
+            "Vary": "Accept-Encoding",
+        },
+    )
+
+
+async def compress_responses(request: Request, call_next):
+    """
+    HTTP middleware compressing successful GET responses above
+    MINIMUM_SIZE with the encoding negotiated from Accept-Encoding.
+    """
+    encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+    if request.method != "GET" or encoding is None:
+        return await call_next(request)
+
+    # The version is read before the handler runs, so a body is never
+    # cached under a version older than the data it was built from.
+    # Only CACHEABLE_ROUTES are ever stored, so other paths always miss.
+    key = (request.url.path, request.url.query, movie_service.version, encoding)
+
+    cached = _cache.get(key)
+    if cached is not None:
+        body, media_type, route, original_size = cached
+        _cache.move_to_end(key)
+
+        # Hits save the same bandwidth as the first response, at no CPU cost
+        stats = _stats[route]
+        stats["cache_hits"] += 1
+        stats["bytes_in"] += original_size
+        stats["bytes_out"] += len(body)
+        return _compressed_response(body, media_type, encoding)
+
+    response = await call_next(request)
+    if response.status_code != 200 or "content-encoding" in response.headers:
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    media_type = response.headers.get("content-type", "application/json")
+
+    if len(body) < MINIMUM_SIZE:
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+        )
+
+    compressed, cpu_seconds = await run_in_threadpool(_compress, encoding, body)
+    route = _route_template(request)
+
+    stats = _stats[route]
+    stats["compressed_responses"] += 1
+    stats["bytes_in"] += len(body)
+    stats["bytes_out"] += len(compressed)
+    stats["cpu_seconds"] += cpu_seconds
+
+    if route in CACHEABLE_ROUTES:
+        _cache[key] = (compressed, media_type, route, len(body))
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+
+    return _compressed_response(compressed, media_type, encoding)
@@ -1,13 +1,15 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
+from pydantic import TypeAdapter
 from typing import List
 from uuid import UUID
 
+from app.api.admission import admit
 from app.schemas.movie_schema import (
     MovieCreateSchema,
     MovieUpdateSchema,
     MovieResponseSchema,
 )
-from app.services.container import movie_service
+from app.services.container import movie_service, read_coalescer
 
 
 router = APIRouter(
@@ -15,11 +17,15 @@ router = APIRouter(
     tags=["movies"],
 )
 
+# Encodes a list of movies straight to JSON bytes
+movie_list_adapter = TypeAdapter(List[MovieResponseSchema])
+
 
 @router.post(
     "",
     response_model=MovieResponseSchema,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[admit("light")],
 )
 def create_movie(data: MovieCreateSchema):
     """
@@ -35,26 +41,40 @@ def create_movie(data: MovieCreateSchema):
 @router.get(
     "",
     response_model=List[MovieResponseSchema],
+    dependencies=[admit("heavy")],
 )
 def list_movies():
     """
     Lists all registered movies.
+    Concurrent requests for the same catalog version share one encoded body.
     """
-    movies = movie_service.list_movies()
-    return [MovieResponseSchema.from_domain(movie) for movie in movies]
+    def encode():
+        movies = movie_service.list_movies()
+        return movie_list_adapter.dump_json(
+            [MovieResponseSchema.from_domain(movie) for movie in movies]
+        )
+
+    body = read_coalescer.do(("movies", movie_service.version), encode)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get(
     "/{movie_id}",
     response_model=MovieResponseSchema,
+    dependencies=[admit("light")],
 )
 def get_movie(movie_id: UUID):
     """
     Retrieves a movie by its ID.
+    Concurrent requests for the same movie version share one encoded body.
     """
-    try:
+    def encode():
         movie = movie_service.get_by_id(movie_id)
-        return MovieResponseSchema.from_domain(movie)
+        return MovieResponseSchema.from_domain(movie).model_dump_json()
+
+    try:
+        body = read_coalescer.do(("movie", movie_id, movie_service.version), encode)
+        return Response(content=body, media_type="application/json")
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -65,6 +85,7 @@ def get_movie(movie_id: UUID):
 @router.put(
     "/{movie_id}",
     response_model=MovieResponseSchema,
+    dependencies=[admit("light")],
 )
 def update_movie(movie_id: UUID, data: MovieUpdateSchema):
     """
@@ -84,6 +105,7 @@ def update_movie(movie_id: UUID, data: MovieUpdateSchema):
 @router.patch(
     "/{movie_id}",
     response_model=MovieResponseSchema,
+    dependencies=[admit("light")],
 )
 def partially_update_movie(movie_id: UUID, data: MovieUpdateSchema):
     """
@@ -103,6 +125,7 @@ def partially_update_movie(movie_id: UUID, data: MovieUpdateSchema):
 @router.delete(
     "/{movie_id}",
     status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[admit("light")],
 )
 def delete_movie(movie_id: UUID):
     """
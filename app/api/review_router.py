@@ -1,13 +1,15 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
+from pydantic import TypeAdapter
 from typing import List
 from uuid import UUID
 
+from app.api.admission import admit
 from app.schemas.review_schema import (
     ReviewCreateSchema,
     ReviewSchema,
     ReviewUpdateSchema,
 )
-from app.services.container import review_service
+from app.services.container import movie_service, read_coalescer, review_service
 
 
 router = APIRouter(
@@ -15,11 +17,15 @@ router = APIRouter(
     tags=["reviews"],
 )
 
+# Encodes a list of reviews straight to JSON bytes
+review_list_adapter = TypeAdapter(List[ReviewSchema])
+
 
 @router.post(
     "",
     response_model=ReviewSchema,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[admit("light")],
 )
 def create_review(movie_id: UUID, data: ReviewCreateSchema):
     """
@@ -38,14 +44,22 @@ def create_review(movie_id: UUID, data: ReviewCreateSchema):
 @router.get(
     "",
     response_model=List[ReviewSchema],
+    dependencies=[admit("heavy")],
 )
 def list_reviews(movie_id: UUID):
     """
     Lists all reviews for a specific movie.
+    Concurrent requests for the same movie version share one encoded body.
     """
-    try:
+    def encode():
         reviews = review_service.list_reviews(movie_id)
-        return [ReviewSchema.from_domain(review) for review in reviews]
+        return review_list_adapter.dump_json(
+            [ReviewSchema.from_domain(review) for review in reviews]
+        )
+
+    try:
+        body = read_coalescer.do(("reviews", movie_id, movie_service.version), encode)
+        return Response(content=body, media_type="application/json")
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -56,6 +70,7 @@ def list_reviews(movie_id: UUID):
 @router.get(
     "/{review_id}",
     response_model=ReviewSchema,
+    dependencies=[admit("light")],
 )
 def get_review(movie_id: UUID, review_id: UUID):
     """
@@ -74,6 +89,7 @@ def get_review(movie_id: UUID, review_id: UUID):
 @router.put(
     "/{review_id}",
     response_model=ReviewSchema,
+    dependencies=[admit("light")],
 )
 def update_review(movie_id: UUID, review_id: UUID, data: ReviewCreateSchema):
     """
@@ -93,6 +109,7 @@ def update_review(movie_id: UUID, review_id: UUID, data: ReviewCreateSchema):
 @router.patch(
     "/{review_id}",
     response_model=ReviewSchema,
+    dependencies=[admit("light")],
 )
 def partially_update_review(movie_id: UUID, review_id: UUID, data: ReviewUpdateSchema):
     """
@@ -112,6 +129,7 @@ def partially_update_review(movie_id: UUID, review_id: UUID, data: ReviewUpdateS
 @router.delete(
     "/{review_id}",
     status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[admit("light")],
 )
 def delete_review(movie_id: UUID, review_id: UUID):
     """
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 import uuid
 
 if TYPE_CHECKING:
@@ -14,8 +14,10 @@ class Movie:
         director: str,
         release_year: int,
         genre: str,
+        movie_id: Optional[uuid.UUID] = None,
     ):
-        self._id = uuid.uuid4()
+        # An explicit ID is only given when loading existing data (e.g. fixtures)
+        self._id = movie_id or uuid.uuid4()
         self._title = title
         self._description = description
         self._director = director
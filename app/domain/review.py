@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 import uuid
 
 # Used only for type hints to avoid circular imports at runtime
@@ -12,8 +12,15 @@ class Review:
     Encapsulates validation and business rules related to reviews.
     """
 
-    def __init__(self, movie: "Movie", analysis: str, rating: int):
-        self._id = uuid.uuid4()
+    def __init__(
+        self,
+        movie: "Movie",
+        analysis: str,
+        rating: int,
+        review_id: Optional[uuid.UUID] = None,
+    ):
+        # An explicit ID is only given when loading existing data (e.g. fixtures)
+        self._id = review_id or uuid.uuid4()
         self._movie = movie
 
         # Use setters to enforce validation rules
@@ -1,23 +1,72 @@
+import threading
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 
+from app.api.admission import admission_stats
+from app.api.compression import compress_responses, compression_stats
 from app.api.movie_router import router as movie_router
 from app.api.review_router import router as review_router
+from app.services import container
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Preload the dataset in the background, so the process reports
+    # itself alive immediately and ready once loading has finished
+    threading.Thread(target=container.preload_dataset, daemon=True).start()
+    yield
 
 
 app = FastAPI(
     title="Movies API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
+# Compress large responses according to the client's Accept-Encoding
+app.middleware("http")(compress_responses)
+
+
 # Register application routers
 app.include_router(movie_router)
 app.include_router(review_router)
 
 
+# Health and metrics handlers are async so they never wait for a worker
+# thread, and keep answering while the threadpool is saturated.
 @app.get("/")
-def healthcheck():
+async def healthcheck():
     """
-    Simple health check endpoint.
+    Simple health check endpoint (liveness).
     """
     return {"status": "ok"}
+
+
+@app.get("/ready")
+async def readiness():
+    """
+    Readiness check endpoint.
+    Returns 503 while the startup dataset is loading or if loading failed.
+    """
+    if container.ready.is_set():
+        return {"status": "ready"}
+
+    status = "failed" if container.startup_error is not None else "loading"
+    return JSONResponse(status_code=503, content={"status": status})
+
+
+@app.get("/metrics")
+async def metrics():
+    """
+    Exposes runtime measurements: in-flight and queued requests per
+    cost class, bandwidth saved by response compression against the
+    CPU time spent per route, and reads served by request coalescing.
+    """
+    return {
+        "admission": admission_stats(),
+        "compression": compression_stats(),
+        "coalescing": container.read_coalescer.stats(),
+    }
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, List
+from uuid import UUID
 
 from app.schemas.review_schema import ReviewSchema
 from app.domain.movie import Movie
@@ -18,6 +19,14 @@ class MovieCreateSchema(BaseModel):
     genre: str
 
 
+class MovieSeedSchema(MovieCreateSchema):
+    """
+    Input schema used to preload movies from a dataset file.
+    The ID is optional, so reviews in the same dataset can reference it.
+    """
+    id: Optional[UUID] = None
+
+
 class MovieUpdateSchema(BaseModel):
     """
     Input schema used to partially update a movie (PATCH).
@@ -49,11 +58,11 @@ class MovieResponseSchema(BaseModel):
         Converts a domain Movie object into a response schema.
         """
         return cls(
-            id=movie.id,
+            id=str(movie.id),
             title=movie.title,
             description=movie.description,
             director=movie.director,
             release_year=movie.release_year,
             genre=movie.genre,
-            reviews=movie.reviews,
+            reviews=[ReviewSchema.from_domain(review) for review in movie.reviews],
         )
@@ -21,6 +21,14 @@ class ReviewCreateSchema(BaseModel):
     )
 
 
+class ReviewSeedSchema(ReviewCreateSchema):
+    """
+    Input schema used to preload reviews from a dataset file.
+    """
+    id: Optional[UUID] = None
+    movie_id: UUID
+
+
 class ReviewUpdateSchema(BaseModel):
     """
     Input schema used to partially update a review (PATCH).
@@ -1,8 +1,49 @@
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from app.services.dataset_loader import DatasetLoader
 from app.services.movie_service import MovieService
 from app.services.review_service import ReviewService
+from app.services.singleflight import SingleFlight
 
 # Single shared instance of MovieService (in-memory storage lives here)
 movie_service = MovieService()
 
 # Single shared instance of ReviewService, using the same MovieService
 review_service = ReviewService(movie_service)
+
+# Shares one serialization between concurrent identical reads.
+# Keys include movie_service.version, so any mutation invalidates them.
+read_coalescer = SingleFlight()
+
+# Set once the startup dataset (if any) has been loaded
+ready = threading.Event()
+
+# Error raised while loading the startup dataset, if any
+startup_error: Optional[Exception] = None
+
+
+def preload_dataset() -> None:
+    """
+    Preloads movies and reviews from the files named by the
+    MOVIES_DATASET and REVIEWS_DATASET environment variables (CSV or JSONL).
+    Either may be set alone; reviews can reference registered movies.
+    Marks the application as ready when done, or records the failure.
+    """
+    global startup_error
+
+    movies_path = os.environ.get("MOVIES_DATASET")
+    reviews_path = os.environ.get("REVIEWS_DATASET")
+
+    try:
+        if movies_path or reviews_path:
+            DatasetLoader(movie_service, review_service).load(
+                Path(movies_path) if movies_path else None,
+                Path(reviews_path) if reviews_path else None,
+            )
+        ready.set()
+    except Exception as error:
+        startup_error = error
+        raise
@@ -0,0 +1,197 @@
+import csv
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+from uuid import UUID
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.domain.movie import Movie
+from app.domain.review import Review
+from app.schemas.movie_schema import MovieSeedSchema
+from app.schemas.review_schema import ReviewSeedSchema
+from app.services.movie_service import MovieService
+from app.services.review_service import ReviewService
+
+
+# Validators for a whole batch of rows at once
+_movie_batch = TypeAdapter(List[MovieSeedSchema])
+_review_batch = TypeAdapter(List[ReviewSeedSchema])
+
+
+def read_rows(path: Path) -> Iterator[dict]:
+    """
+    Lazily reads rows from a CSV (with a header line) or JSONL file.
+
+    :param path: Path to a .csv or .jsonl file
+    :return: Iterator of raw rows
+    :raises ValueError: If the file extension is not supported
+    """
+    suffix = path.suffix.lower()
+
+    if suffix == ".csv":
+        with path.open(newline="", encoding="utf-8") as file:
+            for row in csv.DictReader(file):
+                # Empty cells mean "not provided" (e.g. no fixed ID)
+                yield {key: value for key, value in row.items() if value != ""}
+    elif suffix in (".jsonl", ".ndjson"):
+        with path.open(encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        raise ValueError(f"Unsupported dataset format: {path.suffix}")
+
+
+def validate_chunk(adapter: TypeAdapter, chunk: List[dict], offset: int, path: Path) -> list:
+    """
+    Validates a chunk of rows in one batch.
+
+    :param adapter: Batch validator for the row schema
+    :param chunk: Raw rows
+    :param offset: Number of rows of the file before this chunk
+    :param path: File the rows were read from, used in error messages
+    :return: Validated rows
+    :raises ValueError: If a row is invalid, naming its row number in the file
+    """
+    try:
+        return adapter.validate_python(chunk)
+    except ValidationError as error:
+        # Errors are located as (index in chunk, field, ...)
+        first = error.errors()[0]
+        index, *field = first["loc"]
+        raise ValueError(
+            f"Invalid row {offset + index + 1} of {path}: "
+            f"{'.'.join(map(str, field))}: {first['msg']} "
+            f"(errors in chunk: {error.error_count()})."
+        ) from error
+
+
+def chunked(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    """
+    Splits rows into lists of at most `size` items.
+    """
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class DatasetLoader:
+    """
+    Preloads movies and reviews from dataset files into the services.
+    Rows are parsed in chunks and validated in batches; indexes are
+    built once, after every row has been read.
+    """
+
+    def __init__(
+        self,
+        movie_service: MovieService,
+        review_service: ReviewService,
+        chunk_size: int = 10_000,
+    ):
+        self.movie_service = movie_service
+        self.review_service = review_service
+        self.chunk_size = chunk_size
+
+    def load(
+        self,
+        movies_path: Optional[Path] = None,
+        reviews_path: Optional[Path] = None,
+    ) -> Dict[str, int]:
+        """
+        Loads movies and/or reviews. Reviews may reference movies from
+        the movies file or movies already registered.
+
+        :param movies_path: CSV or JSONL file with movies
+        :param reviews_path: CSV or JSONL file with reviews
+        :return: Number of movies and reviews loaded
+        :raises ValueError: If a row does not match its seed schema, an id
+            is duplicated, or a review references an unknown movie
+        """
+        loaded = {"movies": 0, "reviews": 0}
+        if movies_path is not None:
+            loaded["movies"] = self.load_movies(movies_path)
+        if reviews_path is not None:
+            loaded["reviews"] = self.load_reviews(reviews_path)
+        return loaded
+
+    def load_movies(self, path: Path) -> int:
+        """
+        Loads movies from a dataset file.
+
+        :param path: CSV or JSONL file with movies
+        :return: Number of movies loaded
+        :raises ValueError: If a row is invalid, or a movie id is repeated
+            in the file or already registered
+        """
+        movies: List[Movie] = []
+        seen_ids: Set[UUID] = set()
+        row = 0
+
+        for chunk in chunked(read_rows(path), self.chunk_size):
+            for data in validate_chunk(_movie_batch, chunk, row, path):
+                row += 1
+                if data.id is not None:
+                    if data.id in seen_ids or self.movie_service.exists(data.id):
+                        raise ValueError(
+                            f"Duplicate movie id {data.id} at row {row} of {path}."
+                        )
+                    seen_ids.add(data.id)
+
+                movies.append(
+                    Movie(
+                        title=data.title,
+                        description=data.description,
+                        director=data.director,
+                        release_year=data.release_year,
+                        genre=data.genre,
+                        movie_id=data.id,
+                    )
+                )
+
+        return self.movie_service.bulk_load(movies)
+
+    def load_reviews(self, path: Path) -> int:
+        """
+        Loads reviews from a dataset file. Movies must be loaded first.
+
+        :param path: CSV or JSONL file with reviews
+        :return: Number of reviews loaded
+        :raises ValueError: If a row is invalid, references an unknown movie,
+            or repeats a review id of the same movie
+        """
+        reviews: List[Review] = []
+        # Review ids taken per movie, including reviews already registered
+        seen_ids: Dict[UUID, Set[UUID]] = {}
+        row = 0
+
+        for chunk in chunked(read_rows(path), self.chunk_size):
+            for data in validate_chunk(_review_batch, chunk, row, path):
+                row += 1
+                try:
+                    movie = self.movie_service.get_by_id(data.movie_id)
+                except ValueError as error:
+                    raise ValueError(
+                        f"Unknown movie id {data.movie_id} at row {row} of {path}."
+                    ) from error
+
+                if data.id is not None:
+                    if movie.id not in seen_ids:
+                        seen_ids[movie.id] = {review.id for review in movie.reviews}
+                    if data.id in seen_ids[movie.id]:
+                        raise ValueError(
+                            f"Duplicate review id {data.id} at row {row} of {path}."
+                        )
+                    seen_ids[movie.id].add(data.id)
+
+                reviews.append(
+                    Review(
+                        movie=movie,
+                        analysis=data.analysis,
+                        rating=data.rating,
+                        review_id=data.id,
+                    )
+                )
+
+        return self.review_service.bulk_load(reviews)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, Iterable, List
 from uuid import UUID
 
 from app.domain.movie import Movie
@@ -15,6 +15,28 @@ class MovieService:
         # In-memory storage for movies
         self._movies: List[Movie] = []
 
+        # Index by ID for constant-time lookups
+        self._movies_by_id: Dict[UUID, Movie] = {}
+
+        # Incremented on every change to the catalog (movies or their reviews).
+        # Used as the cache key for representations of unchanged resources.
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Current version of the catalog.
+
+        :return: Integer incremented on every mutation
+        """
+        return self._version
+
+    def touch(self) -> None:
+        """
+        Marks the catalog as changed, invalidating cached representations.
+        """
+        self._version += 1
+
     def create_movie(self, movie_data: MovieCreateSchema) -> Movie:
         """
         Creates a new Movie domain object from a MovieCreateSchema
@@ -26,8 +48,41 @@ class MovieService:
         data = movie_data.model_dump()
         movie = Movie(**data)
         self._movies.append(movie)
+        self._movies_by_id[movie.id] = movie
+        self.touch()
         return movie
 
+    def bulk_load(self, movies: Iterable[Movie]) -> int:
+        """
+        Stores many already validated Movie objects at once.
+        The ID index is updated in a single pass at the end,
+        instead of movie by movie.
+
+        :param movies: Movie objects to store
+        :return: Number of movies loaded
+        :raises ValueError: If an ID is repeated or already registered
+        """
+        new_movies = {}
+        for movie in movies:
+            if movie.id in new_movies or movie.id in self._movies_by_id:
+                raise ValueError(f"Duplicate movie id: {movie.id}")
+            new_movies[movie.id] = movie
+
+        self._movies.extend(new_movies.values())
+        # Only new entries are added, so movies created concurrently are kept
+        self._movies_by_id.update(new_movies)
+        self.touch()
+        return len(new_movies)
+
+    def exists(self, movie_id: UUID) -> bool:
+        """
+        Checks whether a movie is registered.
+
+        :param movie_id: UUID of the movie
+        :return: True if the movie exists
+        """
+        return movie_id in self._movies_by_id
+
     def list_movies(self) -> List[Movie]:
         """
         Returns all registered movies.
@@ -44,11 +99,11 @@ class MovieService:
         :return: Movie object if found
         :raises ValueError: If movie is not found
         """
-        for movie in self._movies:
-            if movie_id == movie.id:
-                return movie
+        movie = self._movies_by_id.get(movie_id)
+        if movie is None:
+            raise ValueError("Movie not found.")
 
-        raise ValueError("Movie not found.")
+        return movie
 
     def update_movie(self, movie_id: UUID, movie_data: MovieUpdateSchema) -> Movie:
         """
@@ -64,9 +119,13 @@ class MovieService:
         # Only update fields that were explicitly sent
         update_data = movie_data.model_dump(exclude_unset=True)
 
-        for field, value in update_data.items():
-            # Uses domain setters, enforcing validation rules
-            setattr(movie, field, value)
+        try:
+            for field, value in update_data.items():
+                # Uses domain setters, enforcing validation rules
+                setattr(movie, field, value)
+        finally:
+            # A failed setter may leave earlier fields already applied
+            self.touch()
 
         return movie
 
@@ -79,3 +138,5 @@ class MovieService:
         """
         movie = self.get_by_id(movie_id)
         self._movies.remove(movie)
+        del self._movies_by_id[movie.id]
+        self.touch()
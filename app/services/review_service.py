@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, Iterable, List, Set
 from uuid import UUID
 
 from app.domain.review import Review
@@ -34,9 +34,36 @@ class ReviewService:
 
         # Add review to the movie aggregate
         movie.reviews.append(review)
+        self.movie_service.touch()
 
         return review
 
+    def bulk_load(self, reviews: Iterable[Review]) -> int:
+        """
+        Attaches many already validated Review objects to their movies at once.
+
+        :param reviews: Review objects, each bound to an existing movie
+        :return: Number of reviews loaded
+        :raises ValueError: If an ID is repeated or already used in its movie
+        """
+        new_reviews = list(reviews)
+
+        # Review IDs already taken, per movie
+        review_ids: Dict[UUID, Set[UUID]] = {}
+        for review in new_reviews:
+            movie = review.movie
+            if movie.id not in review_ids:
+                review_ids[movie.id] = {existing.id for existing in movie.reviews}
+            if review.id in review_ids[movie.id]:
+                raise ValueError(f"Duplicate review id: {review.id}")
+            review_ids[movie.id].add(review.id)
+
+        for review in new_reviews:
+            review.movie.reviews.append(review)
+
+        self.movie_service.touch()
+        return len(new_reviews)
+
     def list_reviews(self, movie_id: UUID) -> List[Review]:
         """
         Lists all reviews for a given movie.
@@ -83,9 +110,12 @@ class ReviewService:
 
         update_data = review_data.model_dump(exclude_unset=True)
 
-        for field, value in update_data.items():
-            # Uses domain setters to enforce validation
-            setattr(review, field, value)
+        try:
+            for field, value in update_data.items():
+                # Uses domain setters to enforce validation
+                setattr(review, field, value)
+        finally:
+            self.movie_service.touch()
 
         return review
 
@@ -101,3 +131,4 @@ class ReviewService:
         review = self.get_review_by_id(movie_id, review_id)
 
         movie.reviews.remove(review)
+        self.movie_service.touch()
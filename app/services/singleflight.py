@@ -0,0 +1,82 @@
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """
+    A computation in progress, shared by every caller using the same key.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into a single execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is still running wait and receive the same result (or a copy of the
+    same exception).
+    Nothing is kept once the call finishes, so keys must include the
+    version of the data they read: after a mutation, new callers use a new
+    key and never join a computation started on the old data.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+        # Number of callers that reused another caller's result
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Runs fn, or waits for the in-flight call with the same key.
+
+        :param key: Identifies the resource and version being computed
+        :param fn: Computation to run if none is in flight for the key
+        :return: Result of fn
+        :raises Exception: Whatever fn raised; callers sharing the call get
+            a copy chained to the original
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                # Each waiter raises its own copy: raising the shared exception
+                # from many threads would keep appending to its traceback
+                raise copy.copy(call.error).with_traceback(None) from call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns coalescing measurements.
+
+        :return: Number of calls in flight and of callers that shared a result
+        """
+        with self._lock:
+            return {"in_flight": len(self._calls), "coalesced": self.coalesced}
@@ -0,0 +1,78 @@
+"""
+Measures bandwidth saved against CPU cost of each available encoding,
+for the payloads of GET /movies and GET /movies/{movie_id}/reviews.
+
+Usage:
+    python -m benchmarks.compression_benchmark [movies] [reviews_per_movie]
+"""
+import sys
+import time
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.api.compression import COMPRESSORS
+from app.schemas.movie_schema import MovieCreateSchema, MovieResponseSchema
+from app.schemas.review_schema import ReviewCreateSchema, ReviewSchema
+from app.services.movie_service import MovieService
+from app.services.review_service import ReviewService
+
+
+def build_catalog(movies: int, reviews_per_movie: int) -> MovieService:
+    movie_service = MovieService()
+    review_service = ReviewService(movie_service)
+
+    for i in range(movies):
+        movie = movie_service.create_movie(
+            MovieCreateSchema(
+                title=f"Movie {i}",
+                description="A story about people doing things in places.",
+                director=f"Director {i % 50}",
+                release_year=1950 + i % 70,
+                genre="Drama",
+            )
+        )
+        for j in range(reviews_per_movie):
+            review_service.create_review(
+                movie.id,
+                ReviewCreateSchema(analysis=f"Review {j}: solid pacing and acting.", rating=j % 11),
+            )
+
+    return movie_service
+
+
+def measure(route: str, body: bytes, rounds: int = 20) -> None:
+    for encoding, compress in COMPRESSORS.items():
+        started = time.perf_counter()
+        for _ in range(rounds):
+            compressed = compress(body)
+        elapsed_ms = (time.perf_counter() - started) / rounds * 1000
+
+        saved = len(body) - len(compressed)
+        print(
+            f"{route:<32} {encoding:<5} {len(body) / 1024:>9.1f} KB -> "
+            f"{len(compressed) / 1024:>8.1f} KB  saved {saved / len(body):>6.1%}  "
+            f"{elapsed_ms:>7.2f} ms/response"
+        )
+
+
+def main() -> None:
+    movies = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    reviews_per_movie = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    movie_service = build_catalog(movies, reviews_per_movie)
+    catalog = movie_service.list_movies()
+
+    movies_body = TypeAdapter(List[MovieResponseSchema]).dump_json(
+        [MovieResponseSchema.from_domain(movie) for movie in catalog]
+    )
+    reviews_body = TypeAdapter(List[ReviewSchema]).dump_json(
+        [ReviewSchema.from_domain(review) for review in catalog[0].reviews]
+    )
+
+    measure("GET /movies", movies_body)
+    measure("GET /movies/{movie_id}/reviews", reviews_body)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Measures load time and memory of preloading a generated dataset.
+
+Usage:
+    python -m benchmarks.seed_benchmark [movies] [reviews] [csv|jsonl]
+"""
+import csv
+import json
+import resource
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from app.services.dataset_loader import DatasetLoader
+from app.services.movie_service import MovieService
+from app.services.review_service import ReviewService
+
+
+def write_dataset(directory: Path, movies: int, reviews: int, fmt: str):
+    movie_ids = [str(uuid.uuid4()) for _ in range(movies)]
+    movie_rows = (
+        {
+            "id": movie_id,
+            "title": f"Movie {i}",
+            "description": "A story about people doing things in places.",
+            "director": f"Director {i % 500}",
+            "release_year": 1950 + i % 70,
+            "genre": "Drama",
+        }
+        for i, movie_id in enumerate(movie_ids)
+    )
+    review_rows = (
+        {
+            "movie_id": movie_ids[i % movies],
+            "analysis": f"Review {i}: solid pacing and acting.",
+            "rating": i % 11,
+        }
+        for i in range(reviews)
+    )
+
+    movies_path = directory / f"movies.{fmt}"
+    reviews_path = directory / f"reviews.{fmt}"
+    for path, rows in ((movies_path, movie_rows), (reviews_path, review_rows)):
+        with path.open("w", newline="", encoding="utf-8") as file:
+            if fmt == "csv":
+                first = next(rows, None)
+                if first is None:
+                    continue
+                writer = csv.DictWriter(file, fieldnames=list(first))
+                writer.writeheader()
+                writer.writerow(first)
+                writer.writerows(rows)
+            else:
+                file.writelines(json.dumps(row) + "\n" for row in rows)
+
+    return movies_path, reviews_path
+
+
+def max_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> None:
+    movies = int(sys.argv[1]) if len(sys.argv) > 1 else 800_000
+    reviews = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    fmt = sys.argv[3] if len(sys.argv) > 3 else "jsonl"
+
+    with tempfile.TemporaryDirectory() as directory:
+        movies_path, reviews_path = write_dataset(Path(directory), movies, reviews, fmt)
+
+        movie_service = MovieService()
+        loader = DatasetLoader(movie_service, ReviewService(movie_service))
+
+        rss_before = max_rss_mb()
+        started = time.perf_counter()
+        loaded = loader.load(movies_path, reviews_path if reviews else None)
+        elapsed = time.perf_counter() - started
+
+    rows = loaded["movies"] + loaded["reviews"]
+    print(f"format:        {fmt}")
+    print(f"rows loaded:   {rows:,} ({loaded['movies']:,} movies, {loaded['reviews']:,} reviews)")
+    print(f"load time:     {elapsed:.2f} s ({rows / elapsed:,.0f} rows/s)")
+    print(f"peak RSS:      {max_rss_mb():,.0f} MB (+{max_rss_mb() - rss_before:,.0f} MB during load)")
+
+
+if __name__ == "__main__":
+    main()
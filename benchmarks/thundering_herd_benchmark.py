@@ -0,0 +1,63 @@
+"""
+Reproduces a thundering herd: many threads request the same movie list
+at the same moment, with and without request coalescing.
+
+Usage:
+    python -m benchmarks.thundering_herd_benchmark [concurrent_requests] [movies]
+"""
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from app.api.movie_router import movie_list_adapter
+from app.schemas.movie_schema import MovieResponseSchema
+from app.services.singleflight import SingleFlight
+from benchmarks.compression_benchmark import build_catalog
+
+
+def herd(requests: int, read: Callable[[], bytes]) -> float:
+    """
+    Releases `requests` threads at once and returns the time until all finish.
+    """
+    barrier = threading.Barrier(requests)
+
+    def request():
+        barrier.wait()
+        return read()
+
+    with ThreadPoolExecutor(max_workers=requests) as executor:
+        started = time.perf_counter()
+        bodies = list(executor.map(lambda _: request(), range(requests)))
+        elapsed = time.perf_counter() - started
+
+    assert len(set(bodies)) == 1
+    return elapsed
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    movies = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    movie_service = build_catalog(movies, reviews_per_movie=5)
+    encodings = 0
+
+    def encode() -> bytes:
+        nonlocal encodings
+        encodings += 1
+        return movie_list_adapter.dump_json(
+            [MovieResponseSchema.from_domain(movie) for movie in movie_service.list_movies()]
+        )
+
+    elapsed = herd(requests, encode)
+    print(f"without coalescing: {elapsed * 1000:>8.1f} ms, {encodings} serializations")
+
+    encodings = 0
+    coalescer = SingleFlight()
+    elapsed = herd(requests, lambda: coalescer.do(("movies", movie_service.version), encode))
+    print(f"with coalescing:    {elapsed * 1000:>8.1f} ms, {encodings} serializations")
+
+
+if __name__ == "__main__":
+    main()